@@ -53,11 +53,16 @@ class EstateProperty(models.Model):
         default=fields.Date.today(),
     )
 
-    # Precio solicitado por el vendedor
-    expected_price = fields.Float(string="Precio Esperado", required=True)
+    # Precio solicitado por el vendedor (se suma por columna al agrupar)
+    expected_price = fields.Float(
+        string="Precio Esperado", required=True, aggregator="sum"
+    )
 
-    # Precio final de venta (solo lectura, se actualiza cuando se vende)
-    selling_price = fields.Float(string="Precio de Venta", readonly=True, copy=False)
+    # Precio final de venta (solo lectura, se actualiza cuando se vende).
+    # Al agrupar se suma, obteniendo el valor vendido por columna.
+    selling_price = fields.Float(
+        string="Precio de Venta", readonly=True, copy=False, aggregator="sum"
+    )
 
     # Número de dormitorios (por defecto 2)
     bedrooms = fields.Integer(string="Dormitorios", default=2)
@@ -153,7 +158,13 @@ class EstateProperty(models.Model):
 
     # Campos calculados
     total_area = fields.Integer(string="Área Total (m²)", compute="_compute_total_area")
-    best_price = fields.Float(string="Mejor Oferta", compute="_compute_best_price")
+    # Almacenado para poder calcular el máximo por columna directamente en SQL
+    best_price = fields.Float(
+        string="Mejor Oferta",
+        compute="_compute_best_price",
+        store=True,
+        aggregator="max",
+    )
 
     # Cálculo del area total
     @api.depends("living_area", "garden_area")